@@ -5,32 +5,130 @@
 # Student Name: Oluwabusayo Akinkuehin
 # Project Topic: Determination of Flow Depth in Open Channel Using Newton-Raphson Method
 
-def manning_discharge(y, b=3.0, n=0.015, S=0.001):
-    """Compute flow discharge Q given flow depth y using Manning’s equation."""
+import math
+import numpy as np
+from collections import namedtuple
+
+# Structured result of the Newton-Raphson solve
+NewtonResult = namedtuple("NewtonResult", ["y", "iters", "converged"])
+
+# Newton steps taken before the first convergence test; from the default
+# wide-channel seed these already reach machine precision
+UNROLLED_ITERATIONS = 4
+
+def _residual_and_deriv(y, Q_target, b, k):
+    """Fused Manning residual and derivative with k = sqrt(S)/n precomputed by the caller."""
     A = b * y
     P = b + 2 * y
     R = A / P
-    Q = (1/n) * A * (R ** (2/3)) * (S ** 0.5)
-    return Q
+    R23 = np.cbrt(R * R)  # R^(2/3) from one cube root instead of exp/log pow
+    Q_y = (A * R23) * k
+    dR = (b * P - A * 2) / (P * P)
+    dQ = k * R23 * (b + (2/3) * P * dR)  # A / R = P, finite at y = 0
+    return Q_y - Q_target, dQ
 
-def f(y, Q_target, b, n, S):
-    """Nonlinear function: difference between computed Q and target Q."""
-    return manning_discharge(y, b, n, S) - Q_target
+def manning_residual_and_deriv(y, Q_target, b, n, S):
+    """Residual Q(y) - Q_target of Manning’s equation and its analytic derivative dQ/dy, in one pass."""
+    return _residual_and_deriv(y, Q_target, b, np.sqrt(S) / n)
 
-def newton_raphson(Q_target, b=3.0, n=0.015, S=0.001, y0=1.0, tol=1e-6, max_iter=100):
-    """Newton-Raphson iteration to find flow depth y."""
-    delta = 1e-6  # Small delta for numerical derivative
+def manning_discharge(y, b=3.0, n=0.015, S=0.001):
+    """Compute flow discharge Q and its analytic derivative dQ/dy using Manning’s equation."""
+    return manning_residual_and_deriv(y, 0.0, b, n, S)
+
+def manning_residual_grid(y, Q_target, b=3.0, n=0.015, S=0.001, out=None):
+    """Residual Q(y) - Q_target for every depth in y (rows) against every target in Q_target (columns)."""
+    y = np.asarray(y, dtype=float).reshape(-1, 1)
+    Q_target = np.asarray(Q_target, dtype=float).reshape(1, -1)
+    # Depth-only quantities stay (M, 1); buffers are reused in place
+    A = np.multiply(b, y)
+    P = np.multiply(2, y)
+    np.add(P, b, out=P)
+    np.divide(A, P, out=P)           # P now holds R
+    np.multiply(P, P, out=P)
+    np.cbrt(P, out=P)                # P now holds R^(2/3)
+    np.multiply(A, P, out=A)
+    np.multiply(A, math.sqrt(S) / n, out=A)  # A now holds Q(y)
+    if out is None:
+        out = np.empty((y.shape[0], Q_target.shape[1]))
+    # Single broadcast pass fills the (M, K) residual grid
+    np.subtract(A, Q_target, out=out)
+    return out
+
+def _newton_raphson(Q_target, b, n, S, y0, tol, max_iter):
+    """Newton-Raphson loop for a single Q_target.
+
+    The first UNROLLED_ITERATIONS steps skip the convergence test; after that the
+    loop continues while |f(y)| >= tol, up to max_iter steps. The residual and
+    derivative of _residual_and_deriv are inlined here on Python floats.
+    """
+    k = math.sqrt(S) / n  # Hoisted out of the iteration
     y = y0
-    for i in range(max_iter):
-        fy = f(y, Q_target, b, n, S)
-        if abs(fy) < tol:
-            print(f"Converged after {i+1} iterations.")
-            return y
-        dfy = (f(y + delta, Q_target, b, n, S) - fy) / delta
+    for i in range(max_iter + 1):
+        A = b * y
+        P = b + 2 * y
+        R = A / P
+        R23 = (R * R) ** (1/3)
+        fy = (A * R23) * k - Q_target
+        if i >= UNROLLED_ITERATIONS and abs(fy) < tol:
+            return NewtonResult(y, i, True)
+        if i == max_iter:
+            break
+        dR = (b * P - A * 2) / (P * P)
+        dfy = k * R23 * (b + (2/3) * P * dR)
         if dfy == 0:
             raise ValueError("Zero derivative encountered.")
         y -= fy / dfy
-    raise RuntimeError("Newton-Raphson did not converge.")
+    return NewtonResult(y, max_iter, abs(fy) < tol)
+
+def _newton_raphson_batch(Q_target, b, n, S, y0, tol, max_iter):
+    """Vectorized Newton-Raphson: solves every entry of Q_target in lockstep."""
+    k = math.sqrt(S) / n  # Hoisted out of the iteration
+    # Dry channels (Q_target <= 0) have depth 0 and are not iterated
+    wet = Q_target > 0
+    Q = Q_target[wet]
+    y = np.array(np.broadcast_to(y0, Q_target.shape)[wet], dtype=float)
+    active = np.ones(Q.shape, dtype=bool)
+    iters = np.zeros(Q.shape, dtype=np.int64)
+    for i in range(max_iter):
+        fy, dfy = _residual_and_deriv(y, Q, b, k)
+        if i >= UNROLLED_ITERATIONS:
+            active &= np.abs(fy) >= tol
+            if not active.any():
+                break
+        if np.any(dfy[active] == 0):
+            raise ValueError("Zero derivative encountered.")
+        y[active] -= fy[active] / dfy[active]
+        iters += active
+    fy, _ = _residual_and_deriv(y, Q, b, k)
+
+    depth = np.zeros(Q_target.shape)
+    depth[wet] = y
+    iters_all = np.zeros(Q_target.shape, dtype=np.int64)
+    iters_all[wet] = iters
+    converged = np.abs(Q_target) < tol
+    converged[wet] = np.abs(fy) < tol
+    return NewtonResult(depth, iters_all, converged)
+
+def newton_raphson(Q_target, b=3.0, n=0.015, S=0.001, y0=None, tol=1e-6, max_iter=100):
+    """Newton-Raphson iteration to find flow depth y for a scalar or an array of Q_target; returns a NewtonResult.
+
+    The default initial guess is the wide-channel depth (P ≈ b); from that seed the
+    first UNROLLED_ITERATIONS steps reach machine precision, so the convergence test
+    usually passes at its first check. A caller-supplied y0 keeps iterating until
+    |f(y)| < tol or max_iter steps. Q_target <= 0 returns depth 0 (a dry channel).
+    A zero derivative raises ValueError for scalar and array input alike.
+    """
+    # Plain numbers skip np.ndim, which costs more than a whole scalar iteration
+    if not isinstance(Q_target, (int, float)) and np.ndim(Q_target) > 0:
+        Q_target = np.asarray(Q_target, dtype=float)
+        if y0 is None:
+            y0 = (np.maximum(Q_target, 0.0) * n / (b * np.sqrt(S))) ** 0.6
+        return _newton_raphson_batch(Q_target, b, n, S, y0, tol, max_iter)
+    if Q_target <= 0:
+        return NewtonResult(0.0, 0, abs(Q_target) < tol)
+    if y0 is None:
+        y0 = (Q_target * n / (b * math.sqrt(S))) ** 0.6
+    return _newton_raphson(Q_target, b, n, S, y0, tol, max_iter)
 
 # Parameters
 Q_target = 10.0  # Discharge (m³/s)
@@ -39,5 +137,8 @@ n = 0.015        # Manning's coefficient
 S = 0.001        # Slope
 
 # Solve for depth
-depth = newton_raphson(Q_target, b, n, S, y0=1.0)
-print(f"Flow depth y ≈ {depth:.4f} meters")
+result = newton_raphson(Q_target, b, n, S)
+if not result.converged:
+    raise RuntimeError("Newton-Raphson did not converge.")
+print(f"Converged after {result.iters} iterations.")
+print(f"Flow depth y ≈ {result.y:.4f} meters")
@@ -24,6 +24,13 @@ Objective:
 
 """
 
+def max_deflection(q, L, E, I, epsilon=0.0):
+    """Midspan deflection of a simply supported beam under UDL, scaled by the exact strain factor 1/(1 + epsilon).
+
+    Accepts scalars or NumPy arrays; array inputs broadcast, so a parameter sweep needs no loop.
+    """
+    return (5 * q) * (L * L) * (L * L) / (384.0 * E * I * (1.0 + epsilon))
+
 # Input parameters
 q = 15000        # Load intensity (N/m)
 L = 6            # Beam length (m)
@@ -33,9 +40,7 @@ epsilon = 0.005  # Axial strain
 
 # Step 1: Calculate standard deflection (without strain)
 # Formula: delta = (5 * q * L⁴) / (384 * E * I)
-L_fourth = L ** 4
-EI = E * I
-delta_standard = (5 * q * L_fourth) / (384 * EI)
+delta_standard = max_deflection(q, L, E, I)
 
 # Step 2: Apply binomial series approximation to (1 + epsilon)⁻¹
 # Binomial expansion: (1 + x)⁻¹ ≈ 1 - x + x² - x³ for small x
@@ -55,8 +60,7 @@ print(f"Standard Deflection (without strain): {delta_standard_mm:.1f} mm")
 print(f"Adjusted Deflection (with strain): {delta_adjusted_mm:.1f} mm")
 
 # Verification: Calculate exact adjusted deflection
-exact_factor = 1 / (1 + epsilon)
-delta_adjusted_exact = delta_standard * exact_factor
+delta_adjusted_exact = max_deflection(q, L, E, I, epsilon)
 delta_adjusted_exact_mm = delta_adjusted_exact * 1000
 print(f"Exact Adjusted Deflection: {delta_adjusted_exact_mm:.1f} mm")
 
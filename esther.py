@@ -26,6 +26,7 @@ Estimate the gradient of the settlement at 0.4 m using:
 - Forward Difference
 - Backward Difference
 - Central Difference
+- Fourth-Order Central Difference
 
 
 
@@ -48,6 +49,12 @@ The finite difference methods are defined as follows:
 - Central Difference:
   f'(x) ≈ [ f(x + h) - f(x - h) ] / 2h
 
+- Fourth-Order Central Difference:
+  f'(x) ≈ [ f(x - 2h) - 8f(x - h) + 8f(x + h) - f(x + 2h) ] / 12h
+
+  Its weights are generated with Fornberg's recursion, which gives the
+  coefficients for any derivative order on any set of grid offsets.
+
 These methods allow estimation of derivatives from discrete data points.
 
 
@@ -55,6 +62,36 @@ These methods allow estimation of derivatives from discrete data points.
 4. PYTHON IMPLEMENTATION
 """
 
+import numpy as np
+
+
+def fd_coeffs(order, offsets):
+    """Finite-difference weights for the `order`-th derivative at 0 on the given grid offsets (Fornberg)."""
+    offsets = np.asarray(offsets, dtype=float)
+    n = offsets.size
+    c = np.zeros((n, order + 1))
+    c[0, 0] = 1.0
+    c1 = 1.0
+    c4 = offsets[0]
+    for k in range(1, n):
+        mn = min(k, order)
+        c2 = 1.0
+        c5 = c4
+        c4 = offsets[k]
+        for j in range(k):
+            c3 = offsets[k] - offsets[j]
+            c2 *= c3
+            if j == k - 1:
+                for m in range(mn, 0, -1):
+                    c[k, m] = c1 * (m * c[k - 1, m - 1] - c5 * c[k - 1, m]) / c2
+                c[k, 0] = -c1 * c5 * c[k - 1, 0] / c2
+            for m in range(mn, 0, -1):
+                c[j, m] = (c4 * c[j, m] - m * c[j, m - 1]) / c3
+            c[j, 0] = c4 * c[j, 0] / c3
+        c1 = c2
+    return c[:, order]
+
+
 # Data
 depths = [0.0, 0.2, 0.4, 0.6, 0.8, 1.0]       # in meters
 settlements = [0.0, 2.1, 3.8, 5.2, 6.0, 6.3]  # in mm
@@ -70,7 +107,12 @@ backward_diff = (settlements[i] - settlements[i - 1]) / h
 # Central Difference
 central_diff = (settlements[i + 1] - settlements[i - 1]) / (2 * h)
 
+# Fourth-Order Central Difference (5-point stencil, offsets -2..2)
+coeffs = fd_coeffs(1, [-2, -1, 0, 1, 2]) / h
+central_diff_4 = np.dot(coeffs, np.asarray(settlements[i - 2:i + 3]))
+
 # Output
 print(f"Forward Difference at 0.4 m: {forward_diff:.2f} mm/m")
 print(f"Backward Difference at 0.4 m: {backward_diff:.2f} mm/m")
 print(f"Central Difference at 0.4 m: {central_diff:.2f} mm/m")
+print(f"Fourth-Order Central Difference at 0.4 m: {central_diff_4:.2f} mm/m")
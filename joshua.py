@@ -1,19 +1,19 @@
 import numpy as np
-from scipy.interpolate import interp1d
 
 # Given data
 x = np.array([0, 3, 6])
 y = np.array([0, 15, 0])
+x_eval = 2
 
-# Linear interpolation
-f_linear = interp1d(x, y, kind='linear')
-y_linear = f_linear(2)
+# Linear interpolation (x_eval lies between x[0] and x[1])
+y_linear = y[0] + (y[1] - y[0]) * (x_eval - x[0]) / (x[1] - x[0])
 
-# Quadratic interpolation
-f_quadratic = interp1d(x, y, kind='quadratic')
-y_quadratic = f_quadratic(2)
-
-print(f"Linear interpolation at x = 2: {y_linear:.2f} mm")
-print(f"Quadratic interpolation at x = 2: {y_quadratic:.2f} mm")
+# Quadratic interpolation (Lagrange form through all three points)
+L0 = ((x_eval - x[1]) * (x_eval - x[2])) / ((x[0] - x[1]) * (x[0] - x[2]))
+L1 = ((x_eval - x[0]) * (x_eval - x[2])) / ((x[1] - x[0]) * (x[1] - x[2]))
+L2 = ((x_eval - x[0]) * (x_eval - x[1])) / ((x[2] - x[0]) * (x[2] - x[1]))
+y_quadratic = y[0] * L0 + y[1] * L1 + y[2] * L2
 
+print(f"Linear interpolation at x = {x_eval}: {y_linear:.2f} mm")
+print(f"Quadratic interpolation at x = {x_eval}: {y_quadratic:.2f} mm")
 
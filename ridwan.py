@@ -1,5 +1,9 @@
+import os
 import numpy as np
+import matplotlib
+matplotlib.use('Agg')  # Non-interactive backend: figures are saved, not shown
 import matplotlib.pyplot as plt
+from scipy.linalg import solve_banded
 
 # -----------------------------------
 # Parameters and Constants
@@ -11,6 +15,7 @@ a = 5.0                         # Load position (meters)
 spread = 0.05                   # Spread of Gaussian approximation of point load
 dx = 0.1                        # Step size for RK4
 N = 101                         # Number of points for Central Difference
+OUTPUT_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "plotted_graphs_ridwan")
 
 # -----------------------------------
 # Load Function: Gaussian approximation of Dirac Delta
@@ -21,33 +26,43 @@ def gaussian_load(x, a, spread):
 # -----------------------------------
 # Runge-Kutta 4th Order Method for Beam Deflection
 # -----------------------------------
-def beam_deflection_rk4():
-    def system_of_odes(x, Y):
-        """
-        Solves: y'''' = w(x)/EI as a system of 1st-order ODEs
-        Y = [y, y', y'', y''']
-        """
-        y1, y2, y3, y4 = Y
-        w = gaussian_load(x, a, spread)
-        return np.array([y2, y3, y4, w / EI])
-
-    def rk4_step(f, x, Y, h):
-        """Runge-Kutta 4th order step"""
-        k1 = f(x, Y)
-        k2 = f(x + h/2, Y + h * k1 / 2)
-        k3 = f(x + h/2, Y + h * k2 / 2)
-        k4 = f(x + h, Y + h * k3)
-        return Y + (h / 6) * (k1 + 2*k2 + 2*k3 + k4)
+def _rk4(dx, w_stage, n_steps):
+    """
+    Solves: y'''' = w(x)/EI as a system of 1st-order ODEs
+    Y = [y, y', y'', y'''], held in scalar locals.
+    w_stage holds w(x)/EI on the half-step grid, so step i reads its start,
+    midpoint and end loads from w_stage[2i], w_stage[2i+1] and w_stage[2i+2]
+    """
+    y_deflections = np.empty(n_steps)
+    h2 = dx / 2
+
+    y1 = y2 = y3 = y4 = 0.0  # Initial conditions: [y, y', y'', y''']
+    for i in range(n_steps):
+        y_deflections[i] = y1  # Store vertical deflection y
+        w0 = w_stage[2 * i]
+        wm = w_stage[2 * i + 1]
+        w1 = w_stage[2 * i + 2]
+
+        # Runge-Kutta 4th order stages, one scalar per component
+        k1_1, k1_2, k1_3, k1_4 = y2, y3, y4, w0
+        k2_1, k2_2, k2_3, k2_4 = y2 + h2 * k1_2, y3 + h2 * k1_3, y4 + h2 * k1_4, wm
+        k3_1, k3_2, k3_3, k3_4 = y2 + h2 * k2_2, y3 + h2 * k2_3, y4 + h2 * k2_4, wm
+        k4_1, k4_2, k4_3, k4_4 = y2 + dx * k3_2, y3 + dx * k3_3, y4 + dx * k3_4, w1
+
+        y1 += (dx / 6) * (k1_1 + 2*k2_1 + 2*k3_1 + k4_1)
+        y2 += (dx / 6) * (k1_2 + 2*k2_2 + 2*k3_2 + k4_2)
+        y3 += (dx / 6) * (k1_3 + 2*k2_3 + 2*k3_3 + k4_3)
+        y4 += (dx / 6) * (k1_4 + 2*k2_4 + 2*k3_4 + k4_4)
+
+    return y_deflections
 
+def beam_deflection_rk4():
     x_vals = np.arange(0, L + dx, dx)
-    Y = np.array([0.0, 0.0, 0.0, 0.0])  # Initial conditions: [y, y', y'', y''']
-    y_deflections = []
-
-    for x in x_vals:
-        y_deflections.append(Y[0])  # Store vertical deflection y
-        Y = rk4_step(system_of_odes, x, Y, dx)
-
-    return x_vals, y_deflections
+    # Evaluate the load once at every RK4 stage point (step ends and midpoints);
+    # adjacent steps share endpoints, so this is 2n+1 exp calls instead of 3n
+    x_stage = np.arange(2 * x_vals.size + 1) * (dx / 2)
+    w_stage = (gaussian_load(x_stage, a, spread) / EI).tolist()
+    return x_vals, _rk4(dx, w_stage, x_vals.size)
 
 # -----------------------------------
 # Central Difference Method for Beam Deflection
@@ -58,23 +73,25 @@ def beam_deflection_central_difference():
     w_vals = gaussian_load(x_vals, a, spread=0.1)  # Use slightly wider spread
     rhs = w_vals / EI * dx**4  # RHS after multiplying both sides by dx⁴
 
-    A = np.zeros((N, N))
+    # A is pentadiagonal, so store only its five diagonals in banded form:
+    # ab[2 + i - j, j] = A[i, j], rows correspond to offsets [+2, +1, 0, -1, -2]
+    ab = np.zeros((5, N))
     b = rhs.copy()
 
-    # Fill matrix A using 4th order central difference:
-    for i in range(2, N - 2):
-        A[i, i-2] = 1
-        A[i, i-1] = -4
-        A[i, i]   = 6
-        A[i, i+1] = -4
-        A[i, i+2] = 1
+    # Fill diagonals using 4th order central difference stencil [1, -4, 6, -4, 1]
+    # for rows i = 2 .. N-3
+    ab[0, 4:]      = 1
+    ab[1, 3:N-1]   = -4
+    ab[2, 2:N-2]   = 6
+    ab[3, 1:N-3]   = -4
+    ab[4, 0:N-4]   = 1
 
     # Apply boundary conditions: Simply Supported Beam (y = 0 at both ends)
-    A[0, 0] = A[1, 1] = A[-2, -2] = A[-1, -1] = 1
+    ab[2, [0, 1, -2, -1]] = 1
     b[0] = b[1] = b[-2] = b[-1] = 0
 
-    # Solve system of equations for deflection
-    y_deflections = np.linalg.solve(A, b)
+    # Solve banded system of equations for deflection
+    y_deflections = solve_banded((2, 2), ab, b)
     return x_vals, y_deflections
 
 # -----------------------------------
@@ -89,13 +106,11 @@ def plot_deflection(x, y, method_name):
 def main():
     # Runge-Kutta Method
     x_rk4, y_rk4 = beam_deflection_rk4()
-    plot_deflection(x_rk4, y_rk4, 'Runge-Kutta Method')
 
     # Central Difference Method
     x_cdf, y_cdf = beam_deflection_central_difference()
-    plot_deflection(x_cdf, y_cdf, 'Central Difference Method')
 
-    # Final Plot
+    # Final Plot (both methods on one figure, drawn once)
     plt.figure(figsize=(10, 4))
     plot_deflection(x_rk4, y_rk4, 'Runge-Kutta Method')
     plot_deflection(x_cdf, y_cdf, 'Central Difference Method')
@@ -105,7 +120,9 @@ def main():
     plt.grid(True)
     plt.legend()
     plt.tight_layout()
-    plt.show()
+    os.makedirs(OUTPUT_DIR, exist_ok=True)
+    plt.savefig(os.path.join(OUTPUT_DIR, "beam_deflection_ridwan.png"), dpi=100)
+    plt.close()
 
 # Run the code
 if __name__ == "__main__":
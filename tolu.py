@@ -46,7 +46,10 @@ BEAM CASES:
 IMPLEMENTATION IN PYTHON
 """
 
+import os
 import numpy as np
+import matplotlib
+matplotlib.use('Agg')  # Non-interactive backend: figures are saved, not shown
 import matplotlib.pyplot as plt
 
 # Constants
@@ -56,15 +59,16 @@ P = 1000            # Point load in Newtons
 w = 500             # UDL in N/m
 L = 2               # Beam length in meters
 
+# Directory where the deflection plots are written
+OUTPUT_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "plotted_graphs_tolu")
+
 def EI():
     return E * I
 
-# Define bending moment functions
+# Define bending moment functions; each accepts scalars or arrays of x
 def M_point_load_center(x):
-    if x <= L / 2:
-        return (P * x) / 2
-    else:
-        return (P * (L - x)) / 2
+    # Branchless form of (P/2)x for x <= L/2 and (P/2)(L - x) otherwise
+    return 0.5 * P * np.minimum(x, L - x)
 
 def M_udl_simply_supported(x):
     return (w / 2) * (L * x - x**2)
@@ -77,15 +81,22 @@ def M_udl_cantilever(x):
 
 # Picard Iteration Method
 def picard_iteration(x_vals, M_func, y0=0, v0=0, iterations=3):
+    # M(x) does not depend on y, so one pass gives the converged integrals;
+    # `iterations` is accepted only for compatibility with earlier callers.
     EI_val = EI()
-    y = [y0 for _ in x_vals]
-    v = [v0 for _ in x_vals]
+    x_vals = np.asarray(x_vals)
     h = x_vals[1] - x_vals[0]
+    # Broadcast so moment functions that return a scalar (constant M) also work
+    Mv = np.broadcast_to(M_func(x_vals), x_vals.shape)
+    v = np.empty(x_vals.size)
+    y = np.empty(x_vals.size)
+
+    dv_scale = h / EI_val  # Bound once: one scalar multiply per element below
 
-    for _ in range(iterations):
-        for i in range(1, len(x_vals)):
-            v[i] = v0 + sum(M_func(x_vals[j]) / EI_val * h for j in range(i))
-            y[i] = y0 + sum(v[j] * h for j in range(i))
+    v[0] = v0
+    v[1:] = v0 + np.cumsum(Mv[:-1] * dv_scale)
+    y[0] = y0
+    y[1:] = y0 + np.cumsum(v[:-1] * h)
     return y
 
 # Root Bisection Method
@@ -112,14 +123,13 @@ def linear_iteration(g, x0, tol=1e-6, max_iter=100):
     raise Exception("Linear iteration did not converge.")
 
 # Plotting function
-def plot_deflection(x_vals, y_vals, title="Beam Deflection"):
-    plt.plot(x_vals, y_vals, label="Deflection")
-    plt.xlabel("x (m)")
-    plt.ylabel("y (m)")
-    plt.title(title)
-    plt.grid(True)
-    plt.legend()
-    plt.show()
+def plot_deflection(ax, x_vals, y_vals, title="Beam Deflection"):
+    ax.plot(x_vals, y_vals, label="Deflection")
+    ax.set_xlabel("x (m)")
+    ax.set_ylabel("y (m)")
+    ax.set_title(title)
+    ax.grid(True)
+    ax.legend()
 
 # Main runner for each beam case
 def solve_and_plot():
@@ -133,10 +143,13 @@ def solve_and_plot():
         ("Cantilever Beam - UDL", M_udl_cantilever),
     ]
 
-    for name, M_func in cases:
+    # One figure for all cases, each beam in its own subplot
+    fig, axes = plt.subplots(2, 2, figsize=(10, 8))
+
+    for (name, M_func), ax in zip(cases, axes.flat):
         y_vals = picard_iteration(x_vals, M_func)
         print(f"Plotting: {name}")
-        plot_deflection(x_vals, y_vals, name)
+        plot_deflection(ax, x_vals, y_vals, name)
 
         # Root bisection example to find max deflection point (where slope ≈ 0)
         def slope_approx(x):
@@ -157,5 +170,10 @@ def solve_and_plot():
         except Exception as e:
             print(f"{name}: Linear Iteration Error -", e)
 
+    fig.tight_layout()
+    os.makedirs(OUTPUT_DIR, exist_ok=True)
+    fig.savefig(os.path.join(OUTPUT_DIR, "Beam_Deflection_Cases.png"), dpi=100)
+    plt.close(fig)
+
 if __name__ == "__main__":
     solve_and_plot()